@@ -1,14 +1,49 @@
 import os
+import io
 import json
+import mmap
+import codecs
+import operator
+import itertools
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+try:
+    import orjson # Optional: parses notebooks several times faster than json
+except ImportError:
+    orjson = None
+try:
+    import ijson # Optional: streams the cells out of large notebooks
+except ImportError:
+    ijson = None
+
+# Errors raised for malformed notebook JSON by whichever parsers are available
+NOTEBOOK_JSON_ERRORS = (json.JSONDecodeError,) if ijson is None else (json.JSONDecodeError, ijson.JSONError)
 
 # --- Constants ---
 STRUCTURE_ONLY_FILENAME = "folder_structure.txt"
 STRUCTURE_WITH_CONTENT_FILENAME = "folder_structure_with_content.txt"
-MAX_FILE_CONTENT_LINES = 10e10  # Max lines of content to include per file if requested
+MAX_FILE_CONTENT_LINES = 10**11  # Max lines of content to include per file if requested
 CSV_PREVIEW_LINES = 10          # Max lines of content to include for CSV files if requested
+MMAP_THRESHOLD_BYTES = 256 * 1024  # Text files larger than this are read through mmap
+MAX_FILE_CONTENT_BYTES = 8 * 1024 * 1024  # Only this many leading bytes of a text file are shown
+ENCODING_PROBE_BYTES = 64 * 1024   # Leading bytes decoded in memory to rule out encodings before reading a file
+BINARY_SNIFF_BYTES = 8 * 1024      # Leading bytes searched for a NUL byte, which marks a file as binary
+DECODE_BLOCK_BYTES = 1 << 20       # Memory-mapped text is decoded in blocks of up to about this many bytes
+WRITE_BATCH_LINES = 512            # Content lines joined into a single write call
+NOTEBOOK_STREAM_THRESHOLD_BYTES = 4 * 1024 * 1024  # Larger notebooks are parsed cell by cell if ijson is installed
+OUTPUT_BUFFER_BYTES = 1 << 20      # Buffer size of the output file
+# Threads listing folders and reading file contents concurrently; 1 (serial) is fastest
+# on local disks. Set PARSE_DIRECTORY_THREADS to opt in (0 sizes the pool from the CPU count).
+try:
+    DEFAULT_THREADS = int(os.environ.get("PARSE_DIRECTORY_THREADS", 1))
+except ValueError: # Not a number: ignore it
+    DEFAULT_THREADS = 1
+DEFAULT_THREADS = DEFAULT_THREADS or min(32, (os.cpu_count() or 1) * 4)
 
 # List of common text file extensions (lowercase)
-TEXT_FILE_EXTENSIONS = {
+TEXT_FILE_EXTENSIONS = frozenset({
     # Plain Text & Markup
     '.txt', '.md', '.markdown', '.rst', '.tex', '.rtf', '.text', '.log',
     # Programming Languages
@@ -37,9 +72,8 @@ TEXT_FILE_EXTENSIONS = {
     # Data Formats
     '.csv', '.tsv', '.jsonl', '.ndjson', '.sql', '.graphql', '.gql', # .csv остается здесь, но будет перехвачен раньше
     # Config & Build Files
-    '.dockerfile', 'dockerfile',
+    '.dockerfile',
     '.gitattributes', '.gitignore', '.gitmodules', '.editorconfig',
-    'makefile', 'makefile.in', 'cmakelists.txt', 'meson.build',
     '.pom', '.gradle', '.sbt', '.project', '.classpath', '.build',
     '.csproj', '.vbproj', '.sln', '.suo',
     '.yaml-tml', # Helm charts
@@ -53,109 +87,432 @@ TEXT_FILE_EXTENSIONS = {
     '.plantuml', '.puml', '.pu', # PlantUML
     '.dot', '.gv', # Graphviz DOT
     # '.ipynb', # Убрано, обрабатывается отдельно
-    '.pro', '.pri', '.src'
-}
-TEXT_FILE_EXTENSIONS.add('') # For files with no extension that might be text
+    '.pro', '.pri', '.src',
+    '', # For files with no extension that might be text
+})
+
+# Well-known text file names (lowercase) that cannot be recognized by extension
+TEXT_FILE_NAMES = frozenset({
+    'dockerfile', 'makefile', 'makefile.in', 'cmakelists.txt', 'meson.build',
+})
 
 # Encodings to try for reading text file content, in order of preference
 ENCODINGS_TO_TRY_FOR_CONTENT = ['utf-8', 'cp1251', 'cp1252', 'latin-1', 'utf-16']
 
+# Byte order marks that settle a file's encoding outright (UTF-32 before UTF-16, whose BOM is its prefix)
+BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+# Byte order marks of the encodings in which NUL bytes are normal text
+WIDE_BOMS = tuple(bom for bom, bom_encoding in BOM_ENCODINGS if bom_encoding in ('utf-16', 'utf-32'))
+
+# Folder names that are listed but not descended into (vendored, generated or VCS data)
+PRUNE_DIR_NAMES = frozenset({'.git', 'node_modules', '__pycache__', '.venv', 'dist', 'build'})
+
+# Tree drawing fragments: the pointers drawn before a middle and the last entry
+# of a folder, and the indentation continued below each of them
+MIDDLE_POINTER, LAST_POINTER = "├── ", "└── "
+MIDDLE_INDENT, LAST_INDENT = "│   ", "    "
+
+# Text that ends a tree line, by the kind yielded from _iter_folder_tree
+TREE_LINE_SUFFIXES = {
+    'folder': " (folder)\n",
+    'pruned': " (folder) [pruned]\n",
+    'file': " (file)\n",
+    'other': " (other)\n",
+    'error': "\n",
+}
+
+
+def _write_prefixed_lines(lines, base_prefix, output_file_obj):
+    """
+    Writes the lines right-stripped and prefixed, up to WRITE_BATCH_LINES per write call.
+    Returns the number of lines written.
+    """
+    line_separator = "\n" + base_prefix
+    write = output_file_obj.write
+    lines_written = 0
+    while True:
+        batch = list(map(str.rstrip, itertools.islice(lines, WRITE_BATCH_LINES)))
+        if not batch:
+            return lines_written
+        write(f"{base_prefix}{line_separator.join(batch)}\n")
+        lines_written += len(batch)
+
+
+def _read_encoding_probe(filepath, probe_size=ENCODING_PROBE_BYTES):
+    """
+    Reads the first probe_size bytes of a file.
+    Returns (probe_bytes, is_whole_file).
+    """
+    with open(filepath, 'rb') as f:
+        probe = f.read(probe_size + 1)
+    return probe[:probe_size], len(probe) <= probe_size
+
+
+@functools.lru_cache(maxsize=None)
+def _load_charset_normalizer():
+    """
+    Imports charset_normalizer on first use, as it is optional and slow to import.
+    Returns its from_bytes function, or None if it is not installed.
+    """
+    try:
+        from charset_normalizer import from_bytes
+    except ImportError:
+        return None
+    return from_bytes
+
+
+def _guess_encoding(sample):
+    """
+    Asks charset_normalizer (if installed) for the encoding of sample.
+    Returns the normalized codec name, or None if there is no usable answer.
+    """
+    from_bytes = _load_charset_normalizer()
+    if from_bytes is None:
+        return None
+    best_match = from_bytes(sample).best()
+    if best_match is None:
+        return None
+    try:
+        return codecs.lookup(best_match.encoding).name
+    except LookupError:
+        return None
+
+
+def _encodings_to_try(sample):
+    """
+    Yields the encodings to try for a file starting with the sample bytes, best first.
+    A byte order mark settles it; the charset guess is only made if the first entry fails.
+    """
+    for bom, bom_encoding in BOM_ENCODINGS:
+        if sample.startswith(bom):
+            yield bom_encoding
+            return
+    first_encoding, *other_encodings = ENCODINGS_TO_TRY_FOR_CONTENT
+    yield first_encoding
+    guessed_encoding = _guess_encoding(sample)
+    if guessed_encoding is not None and guessed_encoding != codecs.lookup(first_encoding).name:
+        yield guessed_encoding
+    for enc in other_encodings:
+        if codecs.lookup(enc).name != guessed_encoding:
+            yield enc
+
+
+def _looks_binary(data):
+    """
+    Returns True if the first BINARY_SNIFF_BYTES hold a NUL byte and no UTF-16/32 BOM.
+    """
+    if data.find(b'\x00', 0, BINARY_SNIFF_BYTES) == -1:
+        return False
+    return not data[:4].startswith(WIDE_BOMS)
+
+
+def _decode_text_lines(data, is_whole_file=True):
+    """
+    Decodes bytes with the first encoding from _encodings_to_try that fits and splits
+    them into lines with universal newlines. Returns (encoding, lines) or (None, None).
+    """
+    for enc in _encodings_to_try(data[:ENCODING_PROBE_BYTES]):
+        try:
+            if is_whole_file:
+                text = data.decode(enc)
+            else: # The bytes may end inside a multi-byte character
+                text = codecs.getincrementaldecoder(enc)().decode(data, final=False)
+        except UnicodeError:
+            continue
+        lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        if not lines[-1]:
+            lines.pop() # Text ends with a newline (or is empty), which starts no new line
+        return enc, lines
+    return None, None
+
+
+def _candidate_encodings(probe, is_whole_file):
+    """
+    Yields the encodings from _encodings_to_try that can decode the probe bytes in memory.
+    """
+    for enc in _encodings_to_try(probe):
+        try:
+            codecs.getincrementaldecoder(enc)().decode(probe, final=is_whole_file)
+        except UnicodeError: # Also covers e.g. a UTF-16 stream without a BOM
+            continue
+        yield enc
+
+
+def _mapped_text_decodes(mm, enc, is_whole_file):
+    """
+    Returns True if all of a memory map decodes strictly with enc, checked block by block.
+    """
+    decoder = codecs.getincrementaldecoder(enc)()
+    try:
+        for start in range(0, len(mm), DECODE_BLOCK_BYTES):
+            decoder.decode(mm[start:start + DECODE_BLOCK_BYTES])
+        decoder.decode(b'', final=is_whole_file)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _iter_mapped_lines(mm, enc, is_whole_file=True, errors='strict'):
+    """
+    Yields the lines of a memory-mapped file decoded with enc,
+    decoding growing blocks cut at line breaks.
+    """
+    decoder = codecs.getincrementaldecoder(enc)(errors=errors)
+    mapped_size = len(mm)
+    block_size = ENCODING_PROBE_BYTES
+    start = 0
+    while start < mapped_size:
+        end = start + block_size
+        block_size = min(block_size * 2, DECODE_BLOCK_BYTES)
+        if end >= mapped_size:
+            end = mapped_size
+        else:
+            break_index = max(mm.rfind(b'\n', start, end), mm.rfind(b'\r', start, end))
+            if break_index == -1: # A single line longer than the block
+                next_breaks = [i for i in (mm.find(b'\n', end), mm.find(b'\r', end)) if i != -1]
+                break_index = min(next_breaks) if next_breaks else -1
+            if break_index == -1:
+                end = mapped_size
+            else:
+                end = break_index + 1
+                if mm[break_index:end] == b'\r' and mm[end:end + 1] == b'\n':
+                    end += 1 # Keep a CRLF pair in one block
+        # A map cut at MAX_FILE_CONTENT_BYTES may end inside a multi-byte character
+        text = decoder.decode(mm[start:end], final=is_whole_file and end == mapped_size)
+        # Universal newlines, as in text-mode iteration and _decode_text_lines
+        lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        if not lines[-1]:
+            lines.pop() # The block ends with a line break, which starts no new line
+        yield from lines
+        start = end
+
+
+def _read_large_text_file_with_mmap(
+    filepath,
+    max_lines,
+    base_prefix,
+    output_file_obj,
+    file_size
+    ):
+    """
+    Reads the first MAX_FILE_CONTENT_BYTES of a large text file through mmap and writes them.
+    Returns None if no byte-oriented encoding fits, so the caller can fall back.
+    """
+    mapped_size = min(file_size, MAX_FILE_CONTENT_BYTES)
+    is_whole_file = mapped_size == file_size
+    try:
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), mapped_size, access=mmap.ACCESS_READ) as mm:
+            if _looks_binary(mm):
+                output_file_obj.write(f"{base_prefix}[Binary content detected - not displayed]\n")
+                return False
+            errors = 'strict'
+            first_enc = None
+            for enc in _candidate_encodings(mm[:ENCODING_PROBE_BYTES], is_whole_file=False):
+                if enc.startswith(('utf-16', 'utf-32')):
+                    continue # Lines cannot be split on b'\n' for UTF-16/32
+                if _mapped_text_decodes(mm, enc, is_whole_file):
+                    break
+                first_enc = first_enc or enc
+            else:
+                if first_enc is None:
+                    return None
+                enc, errors = first_enc, 'replace' # Last resort: show undecodable bytes as U+FFFD
+            output_file_obj.write(f"{base_prefix}--- File Content (text, encoding: {enc}, up to {max_lines} lines) ---\n")
+            lines = _iter_mapped_lines(mm, enc, is_whole_file, errors)
+            lines_written = _write_prefixed_lines(itertools.islice(lines, max_lines), base_prefix, output_file_obj)
+            if lines_written == max_lines and next(lines, None) is not None:
+                output_file_obj.write(f"{base_prefix}[...content truncated...]\n")
+            elif not is_whole_file:
+                output_file_obj.write(f"{base_prefix}[...content truncated after {mapped_size} of {file_size} bytes...]\n")
+            output_file_obj.write(f"{base_prefix}--- File Content End ---\n")
+            return True
+    except (IOError, ValueError) as e:
+        output_file_obj.write(f"{base_prefix}[IOError reading file (memory-mapped): {e}]\n")
+        return False
+
 
 def _read_text_file_content_with_encodings(
     filepath,
     max_lines,
     base_prefix,
-    output_file_obj
+    output_file_obj,
+    file_size=None
     ):
     """
     Tries to read a standard text file with a list of encodings and write its content.
+    At most MAX_FILE_CONTENT_BYTES are read; file_size may be passed in when already known.
     """
-    for enc in ENCODINGS_TO_TRY_FOR_CONTENT:
+    if file_size is None:
         try:
-            with open(filepath, 'r', encoding=enc, errors='strict') as f_content:
-                output_file_obj.write(f"{base_prefix}--- File Content (text, encoding: {enc}, up to {max_lines} lines) ---\n")
-                lines_written = 0
-                content_found_and_printed = False
-                for line_text in f_content:
-                    if lines_written >= max_lines:
-                        output_file_obj.write(f"{base_prefix}[...content truncated...]\n")
-                        content_found_and_printed = True
-                        break
-                    output_file_obj.write(f"{base_prefix}{line_text.rstrip()}\n")
-                    lines_written += 1
-                    content_found_and_printed = True
-                if not content_found_and_printed and lines_written == 0:
-                     output_file_obj.write(f"{base_prefix}[File is empty or content not shown due to 0 line limit]\n")
-                output_file_obj.write(f"{base_prefix}--- File Content End ---\n")
-                return True
-        except UnicodeDecodeError:
-            continue
-        except IOError as e:
-            output_file_obj.write(f"{base_prefix}[IOError reading file (tried encoding {enc}): {e}]\n")
-            return False
-        except Exception as e:
-            output_file_obj.write(f"{base_prefix}[Unexpected error reading file (tried encoding {enc}): {e}]\n")
-            return False
-    output_file_obj.write(f"{base_prefix}[Could not decode file using tried encodings ({', '.join(ENCODINGS_TO_TRY_FOR_CONTENT)}) - Content not displayed]\n")
+            file_size = os.path.getsize(filepath)
+        except OSError:
+            pass # Let the probe below report the error
+    if file_size is not None and file_size > MMAP_THRESHOLD_BYTES:
+        result = _read_large_text_file_with_mmap(filepath, max_lines, base_prefix, output_file_obj, file_size)
+        if result is not None:
+            return result
+
+    try:
+        # Past MMAP_THRESHOLD_BYTES only UTF-16/32 or undecodable files get here.
+        # A known size bounds the read; the extra sentinel byte still catches growth.
+        if file_size is None:
+            probe_size = MMAP_THRESHOLD_BYTES
+        else:
+            probe_size = min(file_size, MAX_FILE_CONTENT_BYTES)
+        probe, is_whole_file = _read_encoding_probe(filepath, probe_size)
+    except IOError as e:
+        output_file_obj.write(f"{base_prefix}[IOError reading file: {e}]\n")
+        return False
+    if _looks_binary(probe):
+        output_file_obj.write(f"{base_prefix}[Binary content detected - not displayed]\n")
+        return False
+
+    enc, lines = _decode_text_lines(probe, is_whole_file)
+    if enc is None:
+        output_file_obj.write(f"{base_prefix}[Could not decode file using tried encodings ({', '.join(ENCODINGS_TO_TRY_FOR_CONTENT)}) - Content not displayed]\n")
+        return False
+    output_file_obj.write(f"{base_prefix}--- File Content (text, encoding: {enc}, up to {max_lines} lines) ---\n")
+    is_truncated = len(lines) > max_lines
+    # The line list is only copied by a slice when the file is actually cut
+    lines_written = _write_prefixed_lines(
+        iter(lines[:max_lines] if is_truncated else lines), base_prefix, output_file_obj
+    )
+    if is_truncated:
+        output_file_obj.write(f"{base_prefix}[...content truncated...]\n")
+    elif not is_whole_file:
+        output_file_obj.write(f"{base_prefix}[...content truncated after {len(probe)} of {file_size} bytes...]\n")
+    elif lines_written == 0:
+        output_file_obj.write(f"{base_prefix}[File is empty or content not shown due to 0 line limit]\n")
+    output_file_obj.write(f"{base_prefix}--- File Content End ---\n")
+    return True
+
+
+def _load_notebook_json(notebook_bytes):
+    """
+    Parses notebook JSON with orjson if installed, else (or if orjson rejects it) with json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(notebook_bytes)
+        except orjson.JSONDecodeError:
+            pass # e.g. NaN, Infinity, 1e400 or lone surrogates, which json accepts
+    return json.loads(notebook_bytes)
+
+
+def _seek_streamed_cells(events):
+    """
+    Advances ijson parse events to the top-level 'cells' value.
+    Returns True if it is an array, False if it is something else or missing.
+    """
+    for prefix, event, _ in events:
+        if prefix == 'cells':
+            return event == 'start_array'
     return False
 
 
-def _read_ipynb_content(filepath, max_lines, base_prefix, output_file_obj):
+def _iter_streamed_cells(events):
+    """
+    Yields the cells of the array started at _seek_streamed_cells as dicts holding only
+    'cell_type' and 'source'; outputs and attachments are skipped as they stream past.
+    """
+    cell = None
+    for prefix, event, value in events:
+        if not prefix.startswith('cells.item'):
+            if prefix == 'cells': # The end of the cells array
+                return
+            continue
+        if prefix == 'cells.item':
+            if event == 'start_map':
+                cell = {}
+            elif event == 'end_map':
+                yield cell
+        elif prefix == 'cells.item.cell_type':
+            cell['cell_type'] = value
+        elif prefix == 'cells.item.source':
+            if event == 'start_array':
+                cell['source'] = []
+            elif event == 'string':
+                cell['source'] = value
+        elif prefix == 'cells.item.source.item' and event == 'string':
+            cell['source'].append(value)
+
+
+def _read_ipynb_content(filepath, max_lines, base_prefix, output_file_obj, file_size=None):
     """
     Reads a .ipynb (Jupyter Notebook) file, extracts markdown and code cells.
+    Notebooks over NOTEBOOK_STREAM_THRESHOLD_BYTES are streamed when ijson is installed.
     """
     output_file_obj.write(f"{base_prefix}--- Jupyter Notebook Content (markdown & code cells, up to {max_lines} lines total) ---\n")
     lines_written_total = 0
     content_processed = False
 
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            notebook_data = json.load(f)
-        
-        if 'cells' not in notebook_data or not isinstance(notebook_data['cells'], list):
-            output_file_obj.write(f"{base_prefix}[Invalid .ipynb format: 'cells' array not found]\n")
-            output_file_obj.write(f"{base_prefix}--- Jupyter Notebook Content End ---\n")
-            return False
-
-        for i, cell in enumerate(notebook_data['cells']):
-            if lines_written_total >= max_lines:
-                break 
-            cell_type = cell.get('cell_type')
-            source = cell.get('source')
-            if not isinstance(source, list):
-                if isinstance(source, str): source = source.splitlines(keepends=True)
-                else: continue
-
-            if cell_type == 'markdown':
-                if lines_written_total < max_lines:
-                    header = f"{base_prefix}[Markdown Cell {i+1}]\n"
-                    output_file_obj.write(header)
-                    lines_written_total += header.count('\n')
-                    content_processed = True
-                for line in source:
-                    if lines_written_total >= max_lines:
+        with open(filepath, 'rb') as f:
+            if ijson is not None and file_size is not None and file_size > NOTEBOOK_STREAM_THRESHOLD_BYTES:
+                events = ijson.parse(f)
+                if not _seek_streamed_cells(events):
+                    output_file_obj.write(f"{base_prefix}[Invalid .ipynb format: 'cells' array not found]\n")
+                    output_file_obj.write(f"{base_prefix}--- Jupyter Notebook Content End ---\n")
+                    return False
+                cells = _iter_streamed_cells(events)
+            else:
+                # Both parsers take the raw bytes, so no text decoding layer is involved
+                notebook_bytes = f.read()
+                notebook_data = _load_notebook_json(notebook_bytes)
+
+                if 'cells' not in notebook_data or not isinstance(notebook_data['cells'], list):
+                    output_file_obj.write(f"{base_prefix}[Invalid .ipynb format: 'cells' array not found]\n")
+                    output_file_obj.write(f"{base_prefix}--- Jupyter Notebook Content End ---\n")
+                    return False
+                cells = notebook_data['cells']
+
+            for i, cell in enumerate(cells):
+                if lines_written_total >= max_lines:
+                    break 
+                cell_type = cell.get('cell_type')
+                source = cell.get('source')
+                if not isinstance(source, list):
+                    if isinstance(source, str): source = source.splitlines(keepends=True)
+                    else: continue
+
+                if cell_type == 'markdown':
+                    if lines_written_total < max_lines:
+                        header = f"{base_prefix}[Markdown Cell {i+1}]\n"
+                        output_file_obj.write(header)
+                        lines_written_total += header.count('\n')
+                        content_processed = True
+                    source_iter = iter(source)
+                    lines_left = max_lines - lines_written_total
+                    lines_written = _write_prefixed_lines(itertools.islice(source_iter, lines_left), base_prefix, output_file_obj)
+                    lines_written_total += lines_written
+                    if lines_written == lines_left and next(source_iter, None) is not None:
                         output_file_obj.write(f"{base_prefix}[...content truncated...]\n")
-                        break
-                    output_file_obj.write(f"{base_prefix}{line.rstrip()}\n")
-                    lines_written_total += 1
-            elif cell_type == 'code':
-                if lines_written_total < max_lines:
-                    header = f"{base_prefix}[Code Cell {i+1}]\n"
-                    output_file_obj.write(header)
-                    lines_written_total += header.count('\n')
-                    content_processed = True
-                for line in source:
-                    if lines_written_total >= max_lines:
+                elif cell_type == 'code':
+                    if lines_written_total < max_lines:
+                        header = f"{base_prefix}[Code Cell {i+1}]\n"
+                        output_file_obj.write(header)
+                        lines_written_total += header.count('\n')
+                        content_processed = True
+                    source_iter = iter(source)
+                    lines_left = max_lines - lines_written_total
+                    lines_written = _write_prefixed_lines(itertools.islice(source_iter, lines_left), base_prefix, output_file_obj)
+                    lines_written_total += lines_written
+                    if lines_written == lines_left and next(source_iter, None) is not None:
                         output_file_obj.write(f"{base_prefix}[...content truncated...]\n")
-                        break
-                    output_file_obj.write(f"{base_prefix}{line.rstrip()}\n")
-                    lines_written_total += 1
         
         if not content_processed and lines_written_total == 0:
             output_file_obj.write(f"{base_prefix}[No markdown or code cells found, or content not shown due to 0 line limit]\n")
 
-    except json.JSONDecodeError as e:
-        output_file_obj.write(f"{base_prefix}[Error decoding .ipynb JSON: {e}]\n")
+    except NOTEBOOK_JSON_ERRORS as e:
+        # yajl-based ijson errors span several lines, which would break the tree layout
+        error_message = ' '.join(str(e).split())
+        output_file_obj.write(f"{base_prefix}[Error decoding .ipynb JSON: {error_message}]\n")
     except IOError as e:
         output_file_obj.write(f"{base_prefix}[IOError reading .ipynb file: {e}]\n")
     except Exception as e:
@@ -164,30 +521,58 @@ def _read_ipynb_content(filepath, max_lines, base_prefix, output_file_obj):
         output_file_obj.write(f"{base_prefix}--- Jupyter Notebook Content End ---\n")
     return content_processed
 
-def _read_csv_content(filepath, max_preview_lines, base_prefix, output_file_obj):
+def _read_csv_content(filepath, max_preview_lines, base_prefix, output_file_obj, file_size=None):
     """
     Reads a .csv file and writes a preview (first N lines), trying multiple encodings.
+    file_size is unused; it keeps the signature shared by the CONTENT_READERS entries.
     """
     content_successfully_read = False
-    for enc in ENCODINGS_TO_TRY_FOR_CONTENT:
+    try:
+        probe, is_whole_file = _read_encoding_probe(filepath)
+    except IOError as e:
+        output_file_obj.write(f"{base_prefix}--- CSV File Content Preview ---\n")
+        output_file_obj.write(f"{base_prefix}[IOError reading CSV file: {e}]\n")
+        output_file_obj.write(f"{base_prefix}--- CSV File Content Preview End ---\n")
+        return False
+    if _looks_binary(probe):
+        output_file_obj.write(f"{base_prefix}--- CSV File Content Preview ---\n")
+        output_file_obj.write(f"{base_prefix}[Binary content detected - not displayed]\n")
+        output_file_obj.write(f"{base_prefix}--- CSV File Content Preview End ---\n")
+        return False
+
+    if is_whole_file:
+        # Файл целиком уже в памяти: декодируем его один раз, без повторного открытия
+        enc, lines = _decode_text_lines(probe)
+        if enc is not None:
+            output_file_obj.write(f"{base_prefix}--- CSV File Content Preview (encoding: {enc}, up to {max_preview_lines} lines) ---\n")
+            is_truncated = len(lines) > max_preview_lines
+            lines_written = _write_prefixed_lines(
+                iter(lines[:max_preview_lines] if is_truncated else lines), base_prefix, output_file_obj
+            )
+            if is_truncated:
+                if lines_written > 0:
+                    output_file_obj.write(f"{base_prefix}[...remaining content truncated...]\n")
+            elif lines_written == 0:
+                output_file_obj.write(f"{base_prefix}[File is empty or preview not shown due to 0 line limit]\n")
+            output_file_obj.write(f"{base_prefix}--- CSV File Content Preview End ---\n")
+            return True
+        candidate_encodings = () # Ни одна кодировка не подошла ко всему файлу
+    else:
+        candidate_encodings = _candidate_encodings(probe, is_whole_file)
+
+    for enc in candidate_encodings:
         try:
             with open(filepath, 'r', encoding=enc, errors='strict') as f_content:
                 # Если открытие успешно, выводим информацию о кодировке и заголовок
                 output_file_obj.write(f"{base_prefix}--- CSV File Content Preview (encoding: {enc}, up to {max_preview_lines} lines) ---\n")
-                lines_written = 0
-                content_found_in_this_attempt = False
-                
-                for line_text in f_content:
-                    if lines_written >= max_preview_lines:
-                        if lines_written > 0: # Только если что-то уже было написано
-                             output_file_obj.write(f"{base_prefix}[...remaining content truncated...]\n")
-                        content_found_in_this_attempt = True
-                        break
-                    output_file_obj.write(f"{base_prefix}{line_text.rstrip()}\n")
-                    lines_written += 1
-                    content_found_in_this_attempt = True
+                lines_written = _write_prefixed_lines(
+                    itertools.islice(f_content, max_preview_lines), base_prefix, output_file_obj
+                )
                 
-                if not content_found_in_this_attempt and lines_written == 0:
+                if lines_written == max_preview_lines and next(f_content, None) is not None:
+                    if lines_written > 0: # Только если что-то уже было написано
+                         output_file_obj.write(f"{base_prefix}[...remaining content truncated...]\n")
+                elif lines_written == 0:
                      output_file_obj.write(f"{base_prefix}[File is empty or preview not shown due to 0 line limit]\n")
                 
                 output_file_obj.write(f"{base_prefix}--- CSV File Content Preview End ---\n")
@@ -217,120 +602,378 @@ def _read_csv_content(filepath, max_preview_lines, base_prefix, output_file_obj)
     return False
 
 
-def _write_folder_tree_recursive(
+# (reader, max lines) by lowercase extension, called as
+# reader(path, max_lines, prefix, output_file, file_size) by _write_file_content
+CONTENT_READERS = {ext: (_read_text_file_content_with_encodings, MAX_FILE_CONTENT_LINES) for ext in TEXT_FILE_EXTENSIONS}
+CONTENT_READERS['.ipynb'] = (_read_ipynb_content, MAX_FILE_CONTENT_LINES) # Общее ограничение для ipynb
+CONTENT_READERS['.csv'] = (_read_csv_content, CSV_PREVIEW_LINES) # Специальное ограничение для CSV
+# Reader for the well-known names in TEXT_FILE_NAMES
+TEXT_FILE_NAME_READER = (_read_text_file_content_with_encodings, MAX_FILE_CONTENT_LINES)
+
+
+@functools.lru_cache(maxsize=4096)
+def _content_reader_for(entry_name):
+    """
+    Returns (content reader or None, extension as written) for a file name.
+    """
+    # Same result as os.path.splitext for names without a leading dot, minus the call.
+    # The name is lowercased once and sliced, serving both lookups below.
+    entry_name_lower = entry_name.lower()
+    dot_index = entry_name_lower.rfind('.')
+    file_ext_lower = entry_name_lower[dot_index:] if dot_index > 0 else ''
+    content_reader = CONTENT_READERS.get(file_ext_lower)
+    if content_reader is None and entry_name_lower in TEXT_FILE_NAMES:
+        content_reader = TEXT_FILE_NAME_READER
+    dot_index = entry_name.rfind('.')
+    return content_reader, entry_name[dot_index:] if dot_index > 0 else ''
+
+
+def _classify_entry(entry):
+    """
+    Returns 'folder', 'file' or 'other' for a DirEntry, without following symlinks.
+    """
+    try:
+        if entry.is_dir(follow_symlinks=False):
+            return 'folder'
+        if entry.is_file(follow_symlinks=False):
+            return 'file'
+    except OSError:
+        pass
+    return 'other'
+
+
+def _scan_folder(current_folder_path, entry_name_to_exclude=None, prune_dir_names=frozenset()):
+    """
+    Returns the visible entries of a folder as (DirEntry, kind) pairs sorted by name.
+    Raises OSError if the folder cannot be listed.
+    """
+    # scandir hands back DirEntry objects with the file type cached from
+    # the directory listing, so classifying them usually needs no extra stat.
+    # Hidden and excluded entries are dropped before sorting, and the excluded
+    # name is only compared in the one folder that passes it.
+    with os.scandir(current_folder_path) as it:
+        listed_entries = [entry for entry in it if not entry.name.startswith('.')]
+    if entry_name_to_exclude is not None:
+        listed_entries = [entry for entry in listed_entries if entry.name != entry_name_to_exclude]
+    listed_entries.sort(key=operator.attrgetter('name'))
+
+    entries_to_process = []
+    for entry in listed_entries:
+        entry_name = entry.name
+        kind = _classify_entry(entry)
+        if kind == 'folder' and entry_name in prune_dir_names:
+            kind = 'pruned'
+        entries_to_process.append((entry, kind))
+    return entries_to_process
+
+
+def _scan_folder_with_subfolders(current_folder_path, entry_name_to_exclude=None, prune_dir_names=frozenset()):
+    """
+    Worker task for _scan_folder_tree: lists one folder and picks out its sub-folders.
+    """
+    entries = _scan_folder(current_folder_path, entry_name_to_exclude, prune_dir_names)
+    subfolder_paths = [entry.path for entry, kind in entries if kind == 'folder']
+    return entries, subfolder_paths
+
+
+def _scan_folder_tree(root_folder_path, output_filename_to_exclude, executor, prune_dir_names=frozenset()):
+    """
+    Lists every folder of the tree on the executor's thread pool.
+    Returns a dict mapping each folder path to its entries or to the OSError raised.
+    """
+    folder_listings = {}
+    pending = {
+        executor.submit(
+            _scan_folder_with_subfolders, root_folder_path, output_filename_to_exclude, prune_dir_names
+        ): root_folder_path
+    }
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            folder_path = pending.pop(future)
+            try:
+                entries, subfolder_paths = future.result()
+            except OSError as e:
+                folder_listings[folder_path] = e
+                continue
+            folder_listings[folder_path] = entries
+            for subfolder_path in subfolder_paths:
+                pending[executor.submit(
+                    _scan_folder_with_subfolders, subfolder_path, None, prune_dir_names
+                )] = subfolder_path
+    return folder_listings
+
+
+def _list_folder_entries(
+    current_folder_path,
+    entry_name_to_exclude=None,
+    folder_listings=None,
+    prune_dir_names=frozenset()
+    ):
+    """
+    Returns the visible entries of a folder, from folder_listings if it was scanned up front.
+    """
+    if folder_listings is None:
+        return _scan_folder(current_folder_path, entry_name_to_exclude, prune_dir_names)
+    listing = folder_listings[current_folder_path]
+    if isinstance(listing, OSError):
+        raise listing
+    return listing
+
+
+def _describe_listing_error(e):
+    """
+    Returns the tree line text shown in place of a folder's entries when listing it failed.
+    """
+    if isinstance(e, PermissionError):
+        return "[Access Denied]"
+    if isinstance(e, FileNotFoundError):
+        return "[Path not found - unexpected]"
+    return f"[Error listing folder: {e}]"
+
+
+def _folder_line_prefixes(prefix):
+    """
+    Returns (middle line prefix, last line prefix, middle child prefix, last child prefix).
+    """
+    return prefix + MIDDLE_POINTER, prefix + LAST_POINTER, prefix + MIDDLE_INDENT, prefix + LAST_INDENT
+
+
+def _iter_folder_tree(
     current_folder_path,
     prefix="",
-    output_file=None,
     output_filename_to_exclude=None,
-    root_folder_abs_path=None,
-    include_file_content=False,
-    files_to_skip_content_processing=None
+    folder_listings=None,
+    prune_dir_names=frozenset()
     ):
-    if files_to_skip_content_processing is None:
-        files_to_skip_content_processing = set()
-
+    """
+    Walks the tree iteratively in pre-order, yielding one
+    (line_prefix, child_prefix, name, kind, entry) tuple per tree line.
+    """
     try:
-        listed_entries = os.listdir(current_folder_path)
-        listed_entries.sort()
-    except PermissionError:
-        if output_file: output_file.write(f"{prefix}├── [Access Denied]\n")
+        entries = _list_folder_entries(current_folder_path, output_filename_to_exclude, folder_listings, prune_dir_names)
+    except OSError as e:
+        yield prefix + MIDDLE_POINTER, prefix + MIDDLE_INDENT, _describe_listing_error(e), 'error', None
         return
-    except FileNotFoundError:
-        if output_file: output_file.write(f"{prefix}├── [Path not found - unexpected]\n")
+    entries_iter = iter(entries)
+    entry_and_kind = next(entries_iter, None)
+    if entry_and_kind is None:
         return
 
-    entries_to_process = []
-    current_folder_abs_path_for_check = os.path.abspath(current_folder_path)
+    # Each frame holds a folder's precomputed prefixes, an iterator over its
+    # remaining entries and the entry to yield next. Peeking one entry ahead
+    # tells whether the current one is the last, so no list of pointers is built.
+    stack = [(_folder_line_prefixes(prefix), entries_iter, entry_and_kind)]
+    while stack:
+        line_prefixes, entries_iter, (entry, kind) = stack.pop()
+        next_entry_and_kind = next(entries_iter, None)
+        if next_entry_and_kind is None:
+            line_prefix = line_prefixes[1]
+            child_prefix = line_prefixes[3]
+        else:
+            line_prefix = line_prefixes[0]
+            child_prefix = line_prefixes[2]
+            stack.append((line_prefixes, entries_iter, next_entry_and_kind))
 
-    for entry_name in listed_entries:
-        if (entry_name == output_filename_to_exclude and
-                current_folder_abs_path_for_check == root_folder_abs_path):
-            continue
-        if entry_name.startswith('.'):
-            continue
-        entries_to_process.append(entry_name)
+        yield line_prefix, child_prefix, entry.name, kind, entry
+        if kind == 'folder':
+            try:
+                child_entries = _list_folder_entries(
+                    entry.path, folder_listings=folder_listings, prune_dir_names=prune_dir_names
+                )
+            except OSError as e:
+                yield child_prefix + MIDDLE_POINTER, child_prefix + MIDDLE_INDENT, _describe_listing_error(e), 'error', None
+                continue
+            child_entries_iter = iter(child_entries)
+            first_child_entry_and_kind = next(child_entries_iter, None)
+            if first_child_entry_and_kind is not None:
+                stack.append((_folder_line_prefixes(child_prefix), child_entries_iter, first_child_entry_and_kind))
 
-    pointers = ["├── "] * (len(entries_to_process) - 1) + ["└── "] if entries_to_process else []
 
-    for i, entry_name in enumerate(entries_to_process):
-        current_path = os.path.join(current_folder_path, entry_name)
-        item_pointer = pointers[i]
+def _write_file_content(entry, full_content_prefix, output_file, files_to_skip_content_processing):
+    """
+    Writes the content block for a single file entry, dispatching on its extension
+    through CONTENT_READERS (see _content_reader_for).
+    """
+    entry_name = entry.name
+    current_path = entry.path
 
-        if os.path.isdir(current_path):
-            output_file.write(f"{prefix}{item_pointer}{entry_name} (folder)\n")
-            extension_for_next_level = "│   " if item_pointer == "├── " else "    "
-            _write_folder_tree_recursive(
-                current_path, prefix + extension_for_next_level, output_file,
-                output_filename_to_exclude, root_folder_abs_path,
-                include_file_content, files_to_skip_content_processing
-            )
-        elif os.path.isfile(current_path):
-            output_file.write(f"{prefix}{item_pointer}{entry_name} (file)\n")
-            if include_file_content:
-                content_base_prefix_ext = "│   " if item_pointer == "├── " else "    "
-                full_content_prefix = prefix + content_base_prefix_ext + "┆ "
-
-                if entry_name in files_to_skip_content_processing:
-                    output_file.write(f"{full_content_prefix}[Content of {entry_name} intentionally not processed for this report]\n")
-                else:
-                    _, file_ext = os.path.splitext(entry_name)
-                    file_ext_lower = file_ext.lower()
-
-                    if file_ext_lower == '.ipynb':
-                        _read_ipynb_content(
-                            current_path,
-                            MAX_FILE_CONTENT_LINES, # Общее ограничение для ipynb
-                            full_content_prefix,
-                            output_file
-                        )
-                    elif file_ext_lower == '.csv': # <--- ОБРАБОТКА CSV
-                        _read_csv_content(
-                            current_path,
-                            CSV_PREVIEW_LINES, # Специальное ограничение для CSV
-                            full_content_prefix,
-                            output_file
-                        )
-                    elif file_ext_lower in TEXT_FILE_EXTENSIONS:
-                        _read_text_file_content_with_encodings(
-                            current_path,
-                            MAX_FILE_CONTENT_LINES, # Общее ограничение для остальных текстовых
-                            full_content_prefix,
-                            output_file
-                        )
-                    else:
-                        output_file.write(f"{full_content_prefix}[Non-text file or unrecognized extension ('{file_ext}') - Content not displayed]\n")
+    if entry_name in files_to_skip_content_processing:
+        output_file.write(f"{full_content_prefix}[Content of {entry_name} intentionally not processed for this report]\n")
+        return
+
+    content_reader, file_ext = _content_reader_for(entry_name)
+    if content_reader is None:
+        output_file.write(f"{full_content_prefix}[Non-text file or unrecognized extension ('{file_ext}') - Content not displayed]\n")
+        return
+
+    # DirEntry caches its stat, so this costs at most one syscall and
+    # spares an open/close pair for every empty file.
+    file_size = None
+    try:
+        file_size = entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        pass # Let the reader report the error
+    if file_size == 0:
+        output_file.write(f"{full_content_prefix}[File is empty]\n")
+        return
+
+    read_content, max_lines = content_reader
+    read_content(current_path, max_lines, full_content_prefix, output_file, file_size)
+
+
+def _render_file_content(entry, full_content_prefix, files_to_skip_content_processing):
+    """
+    Worker task: renders the content block of a file entry into UTF-8 bytes.
+    """
+    # Encoding here keeps encode errors inside the readers' own error handling
+    buffer = io.BytesIO()
+    _write_file_content(entry, full_content_prefix, _Utf8FileWriter(buffer), files_to_skip_content_processing)
+    return buffer.getvalue()
+
+
+class _Utf8FileWriter:
+    """
+    Text front end for a binary output file that encodes each write to UTF-8.
+    """
+
+    def __init__(self, binary_file):
+        self.binary_file = binary_file
+
+    def write(self, text):
+        self.binary_file.write(text.encode('utf-8'))
+
+
+class _OrderedContentWriter:
+    """
+    Stands in for the output file while file contents are rendered on a thread pool,
+    writing everything in call order.
+    """
+
+    def __init__(self, output_file, executor, max_pending):
+        self.output_file = output_file
+        self.executor = executor
+        self.max_pending = max_pending
+        self.pending = deque()  # str blocks and futures, in output order
+        self.pending_futures = 0
+
+    def write(self, text):
+        if self.pending:
+            self.pending.append(text)
+            self._drain()
         else:
-            output_file.write(f"{prefix}{item_pointer}{entry_name} (other)\n")
+            self.output_file.write(text)
+
+    def write_file_content(self, entry, full_content_prefix, files_to_skip_content_processing):
+        self.pending.append(self.executor.submit(
+            _render_file_content, entry, full_content_prefix, files_to_skip_content_processing
+        ))
+        self.pending_futures += 1
+        self._drain()
+
+    def finish(self):
+        """Waits for all outstanding content blocks and writes them out."""
+        self.max_pending = 0
+        self._drain()
+
+    def _drain(self):
+        pending = self.pending
+        while pending:
+            item = pending[0]
+            if isinstance(item, str):
+                self.output_file.write(item)
+            else:
+                if not item.done() and self.pending_futures <= self.max_pending:
+                    break
+                self.output_file.binary_file.write(item.result()) # Already encoded
+                self.pending_futures -= 1
+            pending.popleft()
+
+
+def _write_folder_tree(
+    current_folder_path,
+    prefix="",
+    output_file=None,
+    output_filename_to_exclude=None,
+    include_file_content=False,
+    files_to_skip_content_processing=None,
+    folder_listings=None,
+    prune_dir_names=frozenset()
+    ):
+    """
+    Writes the tree yielded by _iter_folder_tree, optionally with file contents.
+    """
+    if files_to_skip_content_processing is None:
+        files_to_skip_content_processing = set()
+
+    ordered_output = output_file if isinstance(output_file, _OrderedContentWriter) else None
+
+    tree_lines = []
+    add_tree_line_parts = tree_lines.extend
+    for line_prefix, child_prefix, entry_name, kind, entry in _iter_folder_tree(
+            current_folder_path, prefix, output_filename_to_exclude, folder_listings, prune_dir_names):
+        add_tree_line_parts((line_prefix, entry_name, TREE_LINE_SUFFIXES[kind]))
+        if kind == 'folder':
+            output_file.write("".join(tree_lines))
+            tree_lines.clear()
+        elif kind == 'file' and include_file_content:
+            output_file.write("".join(tree_lines))
+            tree_lines.clear()
+            full_content_prefix = child_prefix + "┆ "
+            if ordered_output is not None:
+                ordered_output.write_file_content(entry, full_content_prefix, files_to_skip_content_processing)
+            else:
+                _write_file_content(entry, full_content_prefix, output_file, files_to_skip_content_processing)
+    output_file.write("".join(tree_lines))
 
 
 def _generate_and_save_single_structure_file(
     root_folder_path,
     output_filename,
     include_file_content_flag,
-    additional_files_to_skip_content=None
+    additional_files_to_skip_content=None,
+    threads=DEFAULT_THREADS,
+    prune_dir_names=PRUNE_DIR_NAMES
 ):
-    if not os.path.exists(root_folder_path):
-        print(f"Error: Path '{root_folder_path}' does not exist.")
-        return False
+    # isdir alone settles the common case with one stat; exists is only asked to word the error
     if not os.path.isdir(root_folder_path):
-        print(f"Error: Path '{root_folder_path}' is not a directory.")
+        if not os.path.exists(root_folder_path):
+            print(f"Error: Path '{root_folder_path}' does not exist.")
+        else:
+            print(f"Error: Path '{root_folder_path}' is not a directory.")
         return False
 
     output_filepath = os.path.join(root_folder_path, output_filename)
-    root_folder_abs_path_for_check = os.path.abspath(root_folder_path)
 
+    # With more than one thread the whole tree is listed concurrently before
+    # writing and file contents are read ahead of the writer; threads=1 keeps
+    # the plain serial walk (e.g. for fast local disks).
+    executor = ThreadPoolExecutor(max_workers=threads) if threads > 1 else None
     try:
-        with open(output_filepath, 'w', encoding='utf-8') as f:
+        folder_listings = None
+        if executor is not None:
+            folder_listings = _scan_folder_tree(
+                root_folder_path, output_filename, executor, prune_dir_names
+            )
+
+        with open(output_filepath, 'wb', buffering=OUTPUT_BUFFER_BYTES) as binary_file:
+            f = _Utf8FileWriter(binary_file)
             f.write(f"{os.path.basename(os.path.abspath(root_folder_path))} (folder)\n")
-            _write_folder_tree_recursive(
+            tree_output = f
+            if executor is not None and include_file_content_flag:
+                tree_output = _OrderedContentWriter(f, executor, max_pending=threads * 4)
+            _write_folder_tree(
                 root_folder_path,
                 prefix="  ",
-                output_file=f,
+                output_file=tree_output,
                 output_filename_to_exclude=output_filename,
-                root_folder_abs_path=root_folder_abs_path_for_check,
                 include_file_content=include_file_content_flag,
-                files_to_skip_content_processing=additional_files_to_skip_content
+                files_to_skip_content_processing=additional_files_to_skip_content,
+                folder_listings=folder_listings,
+                prune_dir_names=prune_dir_names
             )
+            if tree_output is not f:
+                tree_output.finish()
         print(f"Successfully saved to: {output_filepath}")
         return True
     except IOError as e:
@@ -339,8 +982,16 @@ def _generate_and_save_single_structure_file(
     except Exception as e:
         print(f"An unexpected error occurred while processing '{output_filename}': {e}")
         return False
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-if __name__ == "__main__":
+
+def main():
+    """
+    Interactive entry point: asks for the folder and options, then writes the
+    structure-only report and, if requested, the report with file contents.
+    """
     target_directory = input("Enter path to the folder to analyze (default: current directory): ")
     if not target_directory.strip():
         target_directory = "." 
@@ -353,6 +1004,16 @@ if __name__ == "__main__":
     ).lower()
     should_parse_with_content = parse_with_content_input in ['yes', 'y']
 
+    prune_dir_names_input = input(
+        f"Folders to list without descending into, comma-separated ('none' for none) [{', '.join(sorted(PRUNE_DIR_NAMES))}]: "
+    ).strip()
+    if not prune_dir_names_input:
+        prune_dir_names = PRUNE_DIR_NAMES
+    elif prune_dir_names_input.lower() == 'none':
+        prune_dir_names = frozenset()
+    else:
+        prune_dir_names = frozenset(name.strip() for name in prune_dir_names_input.split(',') if name.strip())
+
     print(f"\nGenerating documentation for '{os.path.abspath(target_directory)}'...")
 
     print(f"\nAttempting to create structure-only file: '{STRUCTURE_ONLY_FILENAME}'")
@@ -360,7 +1021,8 @@ if __name__ == "__main__":
         target_directory,
         output_filename=STRUCTURE_ONLY_FILENAME,
         include_file_content_flag=False,
-        additional_files_to_skip_content=None
+        additional_files_to_skip_content=None,
+        prune_dir_names=prune_dir_names
     )
 
     if should_parse_with_content:
@@ -370,7 +1032,12 @@ if __name__ == "__main__":
             target_directory,
             output_filename=STRUCTURE_WITH_CONTENT_FILENAME,
             include_file_content_flag=True,
-            additional_files_to_skip_content=files_to_skip_for_this_report
+            additional_files_to_skip_content=files_to_skip_for_this_report,
+            prune_dir_names=prune_dir_names
         )
 
-    print("\nDocumentation generation finished.")
\ No newline at end of file
+    print("\nDocumentation generation finished.")
+
+
+if __name__ == "__main__":
+    main()